@@ -0,0 +1,63 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Micro-benchmark for generating, parsing and validating statement names in bulk.
+
+Usage:
+    python lambda/python/benchmarks/statement_name_benchmark.py [number_of_names]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'rs_integration_function'))
+
+from statement_class import StatementName  # noqa: E402
+
+EXECUTION_ARN = "arn:aws:states:eu-west-1:012345678910:execution:MachineName:fb69bfdf-e22c-4362-8f9e-48fb72c445b7"
+REPEAT = 5
+
+
+def build_statement_names(number_of_names: int) -> list:
+    statement_names = [str(StatementName(EXECUTION_ARN, StatementName.generate_id())) for _ in range(number_of_names)]
+    # Mix in legacy invocation ids and names that were not started from a step function.
+    statement_names[::3] = [f"{EXECUTION_ARN}:{name.rpartition(':')[2].split('-')[0]}" for name in statement_names[::3]]
+    statement_names[1::5] = ["arn:::eu-west-1::custom_invocation:adhoc:1617000000.0"] * len(statement_names[1::5])
+    return statement_names
+
+
+def parse_all(statement_names: list) -> int:
+    parsed = 0
+    for statement_name in statement_names:
+        try:
+            StatementName.from_str(statement_name)
+            parsed += 1
+        except StatementName.NoSfnStatementName:
+            pass
+    return parsed
+
+
+def validate_all(statement_names: list) -> int:
+    return sum(StatementName._is_sfn_invocation(statement_name) for statement_name in statement_names)
+
+
+def generate_all(number_of_names: int) -> int:
+    return len({StatementName.generate_id() for _ in range(number_of_names)})
+
+
+def main(number_of_names: int) -> None:
+    statement_names = build_statement_names(number_of_names)
+    assert generate_all(number_of_names) == number_of_names, "Generated invocation ids are not unique"
+    benchmarks = {
+        'generate_id': lambda: generate_all(number_of_names),
+        'from_str': lambda: parse_all(statement_names),
+        '_is_sfn_invocation': lambda: validate_all(statement_names),
+    }
+    for benchmark_name, benchmark in benchmarks.items():
+        best = min(timeit.repeat(benchmark, number=1, repeat=REPEAT))
+        print(f"{benchmark_name:<20} {number_of_names} names: {best * 1000:8.2f} ms ({best / number_of_names * 1e6:.2f} us/name)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
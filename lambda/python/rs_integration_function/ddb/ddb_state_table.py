@@ -105,7 +105,7 @@ class DDBStateTable(object):
             raise e
         return StatementName(
             execution_arn,
-            invocation_id=str(max(float(i[DDB_INVOCATION_ID]) for i in items))
+            invocation_id=max((i[DDB_INVOCATION_ID] for i in items), key=StatementName.invocation_id_sort_key)
         )
 
     @classmethod
@@ -3,7 +3,10 @@
 
 
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Tuple
 from uuid import uuid4
 
 
@@ -13,7 +16,13 @@ class StatementName(object):
     We cannot make assumptions about the partition but we can check the ARN and SERVICE parts of the ARN.
     For non-step function invocations an ARN of the invoker can be provided if nothing is provided then default to an
     ARN like arn:::{region}::custom_invocation:{uuid4}
+
+    The invocation id is `{epoch_seconds}.{microseconds}-{container_tag}`. The timestamp is strictly increasing within a
+    container and the container tag is random per container which makes invocation ids unique for parallel branches of
+    a single execution. Legacy invocation ids without container tag (e.g. `1617000000.123456`) are still accepted.
     """
+    __slots__ = ('execution_arn', 'invocation_id')
+
     ARN_IDX = 0
     PARTITION_IDX = 1
     SERVICE_IDX = 2
@@ -28,42 +37,75 @@ class StatementName(object):
     STATES = "states"
     EXECUTION_ACTION = "execution"
 
+    INVOCATION_ID_SEPARATOR = "-"
+    ONE_YEAR_IN_SECONDS = 52 * 7 * 24 * 60 * 60
+
+    _container_tag = uuid4().hex[:12]
+    _last_invocation_us = 0
+    _invocation_id_lock = threading.Lock()
+
     class NoSfnStatementName(Exception):
         pass
 
     @classmethod
     def generate_id(cls) -> str:
-        return str(datetime.utcnow().timestamp())
+        with cls._invocation_id_lock:
+            invocation_us = max(time.time_ns() // 1000, cls._last_invocation_us + 1)
+            cls._last_invocation_us = invocation_us
+        seconds, micro_seconds = divmod(invocation_us, 1000000)
+        return f"{seconds}.{micro_seconds:06d}{cls.INVOCATION_ID_SEPARATOR}{cls._container_tag}"
+
+    @classmethod
+    def _invocation_id_to_timestamp(cls, invocation_id: str) -> float:
+        """Raises ValueError if the invocation_id is not a (legacy) invocation id."""
+        timestamp, separator, container_tag = invocation_id.partition(cls.INVOCATION_ID_SEPARATOR)
+        if separator and not container_tag.isalnum():
+            raise ValueError(f"Invalid container tag in invocation_id {invocation_id}")
+        return float(timestamp)
 
     @classmethod
     def _invocation_id_to_datetime(cls, invocation_id):
-        return datetime.fromtimestamp(float(invocation_id))
+        return datetime.fromtimestamp(cls._invocation_id_to_timestamp(invocation_id))
 
     def invocation_id_to_datetime(self):
         return self._invocation_id_to_datetime(self.invocation_id)
 
+    @classmethod
+    def invocation_id_sort_key(cls, invocation_id: str) -> Tuple[float, str]:
+        """Key to order invocation ids chronologically, usable with both legacy and current invocation ids."""
+        return cls._invocation_id_to_timestamp(invocation_id), invocation_id
+
     @classmethod
     def is_id(cls, candidate: str) -> bool:
         try:
-            invocation_dt = cls._invocation_id_to_datetime(candidate)
-            one_year = timedelta(weeks=52)
-            now = datetime.utcnow()
-            return now - one_year < invocation_dt < datetime.utcnow() + one_year
+            invocation_ts = cls._invocation_id_to_timestamp(candidate)
         except ValueError:
             return False
+        now = time.time()
+        return now - cls.ONE_YEAR_IN_SECONDS < invocation_ts < now + cls.ONE_YEAR_IN_SECONDS
+
+    @classmethod
+    def _parse(cls, statement_name: str) -> Optional[Tuple[str, str]]:
+        """
+        Split a statement name in execution ARN and invocation id with a single pass over the string.
+        Returns None if the statement name was not created for a step function invocation.
+        """
+        arn_parts = statement_name.split(':')
+        if len(arn_parts) != cls.INVOCATION_ID_IDX + 1:
+            return None
+        invocation_id = arn_parts[cls.INVOCATION_ID_IDX]
+        if (
+            arn_parts[cls.ARN_IDX] == cls.ARN
+            and arn_parts[cls.SERVICE_IDX] == cls.STATES
+            and arn_parts[cls.ACTION_IDX] == cls.EXECUTION_ACTION
+            and cls.is_id(invocation_id)
+        ):
+            return statement_name[:-len(invocation_id) - 1], invocation_id
+        return None
 
     @classmethod
     def _is_sfn_invocation(cls, statement_instance: str) -> bool:
-        arn_parts = statement_instance.split(':')
-        try:
-            return all([
-                arn_parts[cls.ARN_IDX] == cls.ARN,
-                arn_parts[cls.SERVICE_IDX] == cls.STATES,
-                arn_parts[cls.ACTION_IDX] == cls.EXECUTION_ACTION,
-                cls.is_id(arn_parts[cls.INVOCATION_ID_IDX])
-            ])
-        except IndexError:
-            return False
+        return cls._parse(statement_instance) is not None
 
     def is_sfn_invocation(self):
         return self._is_sfn_invocation(str(self))
@@ -75,13 +117,13 @@ class StatementName(object):
 
     @classmethod
     def from_str(cls, statement_name: str):
-        if not cls._is_sfn_invocation(statement_name):
+        parsed = cls._parse(statement_name)
+        if parsed is None:
             raise cls.NoSfnStatementName(statement_name)
-        statement_name_parts = statement_name.split(':')
-        return cls(
-            execution_arn=':'.join(statement_name_parts[:cls.INVOCATION_ID_IDX]),
-            invocation_id=statement_name_parts[cls.INVOCATION_ID_IDX]
-        )
+        # The invocation id is already validated by _parse so skip the validation in __init__.
+        instance = cls.__new__(cls)
+        instance.execution_arn, instance.invocation_id = parsed
+        return instance
 
     def __str__(self):
         return f"{self.execution_arn}:{self.invocation_id}"